@@ -8,7 +8,7 @@ Features
 --------
 * MQTT Topics       : ``pos/print``  (jobs)  |  ``pos/print/status`` (ack + heartbeat)
 * HA Discovery      : sensor + binary_sensor published on startup
-* Redis Spool       : 10 lists ``print_queue:0`` … ``print_queue:9`` (0 = highest prio)
+* Redis Spool       : sorted set ``print_queue`` scored by priority (0 = highest prio)
 * Printer Width     : 80 mm default, overridable per job (field ``paper_width``)
 * UTF‑8             : ``SetTextEncoding(ENCODING_ASCII)``
 * No automatic retries – on error an error ACK is sent, remaining items keep printing.
@@ -30,9 +30,15 @@ IMAGE_FETCH_TIMEOUT=10
 """
 from __future__ import annotations
 
-import base64
+try:
+    # SIMD-accelerated drop-in (NEON on ARM, AVX2/SSSE3 on x86); ~20x stdlib
+    # throughput for the large data-URI payloads handled in _print_image.
+    import pybase64 as base64  # type: ignore
+except ImportError:  # pragma: no cover
+    import base64
 import binascii
 import io
+import itertools
 import json
 import logging
 import os
@@ -71,11 +77,35 @@ try:
 except ImportError:
     psutil = None  # pragma: no cover
 
+try:
+    # Rust/SIMD JSON codec, ~3-5x stdlib; emits bytes, which both paho
+    # and binary-mode Redis accept without a round trip through str.
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
 load_dotenv()
 
 BRIDGE_VERSION = "0.1.0"
 REPO_URL = "https://github.com/fro3hnel/ha-pos-printer-custom-component.git"
 
+_THERMAL_ZONE = Path("/sys/class/thermal/thermal_zone0/temp")
+
+
+def _read_cpu_temp() -> float | None:
+    """CPU temperature via one sysfs read instead of a full psutil scan."""
+    try:
+        return int(_THERMAL_ZONE.read_text()) / 1000
+    except (OSError, ValueError):
+        return None
+
 @dataclass(slots=True)
 class Config:
     mqtt_broker: str = os.getenv("MQTT_BROKER", "localhost")
@@ -98,17 +128,40 @@ logging.basicConfig(level=getattr(logging, CFG.log_level.upper()))
 LOGGER = logging.getLogger("printer_bridge")
 
 
-def _decode_data_uri(content: str) -> bytes:
+# pybase64 can decode straight into a fresh bytearray, skipping one full
+# copy of the decoded image; the stdlib has no equivalent entry point.
+_b64decode = getattr(base64, "b64decode_as_bytearray", base64.b64decode)
+
+_B64_STRIP = str.maketrans("", "", " \t\n\r")
+
+
+def _strip_b64_whitespace(payload: str) -> str:
+    """Remove MIME 76-column line wrapping in one C-level scan.
+
+    Whitespace knocks the decoder off its SIMD fast path (and trips
+    validate=True); stripping is only done when a probe actually finds
+    some, so clean payloads pay a single scan.
+    """
+    if "\n" in payload or " " in payload:
+        return payload.translate(_B64_STRIP)
+    return payload
+
+
+def _decode_data_uri(content: str) -> bytes | bytearray:
     """Decode a data URI into raw image bytes."""
-    if "," not in content:
+    comma = content.find(",")
+    if comma == -1:
         raise ValueError("Data URI is missing comma separator")
-    header, payload = content.split(",", 1)
-    if ";base64" in header.lower():
+    # Slice only the small header for inspection; the payload is sliced once
+    # instead of being copied twice via split().
+    if ";base64" in content[:comma].lower():
         try:
-            return base64.b64decode(payload, validate=True)
+            return _b64decode(
+                _strip_b64_whitespace(content[comma + 1:]), validate=True
+            )
         except binascii.Error as exc:
             raise ValueError("Invalid base64 payload in data URI") from exc
-    return unquote_to_bytes(payload)
+    return unquote_to_bytes(content[comma + 1:])
 
 
 def _fetch_image_from_uri(uri: str, timeout: int) -> bytes:
@@ -118,7 +171,7 @@ def _fetch_image_from_uri(uri: str, timeout: int) -> bytes:
         return response.read()
 
 
-def _load_image_bytes(content: str, timeout: int) -> bytes:
+def _load_image_bytes(content: str, timeout: int) -> bytes | bytearray:
     """Load image bytes from Base64, data URI, or URI string."""
     source = content.strip()
     if not source:
@@ -135,7 +188,7 @@ def _load_image_bytes(content: str, timeout: int) -> bytes:
         return data
 
     try:
-        return base64.b64decode(source, validate=True)
+        return _b64decode(_strip_b64_whitespace(source), validate=True)
     except binascii.Error as exc:
         raise ValueError(
             "Image content must be Base64, data URI, or URI (http/https/file)"
@@ -162,35 +215,58 @@ class MQTTLogHandler(logging.Handler):
                 "file": record.filename,
                 "line": record.lineno,
             }
-            self._client.publish(self._topic, json.dumps(payload), qos=0, retain=False)
+            self._client.publish(self._topic, _json_dumps(payload), qos=0, retain=False)
         except Exception:
             # Never let telemetry logging break bridge execution.
             pass
 
 
 class RedisSpool:
-    """Priority spool backed by 10 Redis lists."""
+    """Priority spool backed by a single Redis sorted set.
+
+    Jobs are scored priority-major / arrival-time-minor, so popping the
+    lowest score yields the highest priority first and stays FIFO within
+    a priority.  One ZSET means one round-trip per operation instead of
+    ten list probes.
+
+    ZSET members must be unique or ZADD collapses duplicates into a
+    score update, so push() assigns a job_id to jobs that arrive
+    without one - two identical queued jobs must both print.
+    """
+
+    _KEY = "print_queue"
 
     def __init__(self, url: str):
-        self.redis = redis.Redis.from_url(url, decode_responses=True)
+        # Pooled client on purpose: the spool is hit from the paho callback
+        # thread, the worker and the heartbeat loop concurrently, and
+        # single_connection_client is not thread-safe.  length() is already
+        # a single ZCARD round trip since the sorted-set migration.
+        self.redis = redis.Redis.from_url(url, socket_keepalive=True)
         self._lock = threading.Lock()
+        self._seq = itertools.count()
 
     def push(self, job: dict[str, Any], priority: int) -> None:
         prio = max(0, min(priority, 9))
-        self.redis.rpush(f"print_queue:{prio}", json.dumps(job))
+        # Without a job_id two byte-identical jobs would serialize to the
+        # same ZSET member and the second would never print.
+        if not job.get("job_id"):
+            job = {
+                **job,
+                "job_id": f"ts{int(time.time() * 1000)}-{next(self._seq)}",
+            }
+        self.redis.zadd(self._KEY, {_json_dumps(job): prio * 1e9 + time.time()})
         LOGGER.debug("Job pushed to priority %s", prio)
 
     def pop(self, timeout: int = 5) -> dict[str, Any] | None:
-        """Pop job with highest priority available – blocking BRPOP."""
-        keys = [f"print_queue:{i}" for i in range(10)]  # 0..9
-        res = self.redis.blpop(keys, timeout=timeout)
+        """Pop job with highest priority available – blocking BZPOPMIN."""
+        res = self.redis.bzpopmin(self._KEY, timeout=timeout)
         if res:
-            _key, raw = res
-            return json.loads(raw)
+            _key, raw, _score = res
+            return _json_loads(raw)
         return None
 
     def length(self) -> int:
-        return sum(self.redis.llen(f"print_queue:{i}") for i in range(10))
+        return self.redis.zcard(self._KEY)
 
 class _BarcodeInfo(Structure):
     _fields_ = [
@@ -208,6 +284,13 @@ class BixolonPrinter:
     _FONTA = 0  # ATTR_FONTTYPE_A
     _SIZE0 = 0  # TS_HEIGHT_0 | TS_WIDTH_0
 
+    # Pre-marshalled ctypes constants: PrintText/LineFeed run once per
+    # receipt line, so skip the Python->C coercion on every call.
+    _ALIGN_C = {"left": c_int(0), "center": c_int(1), "right": c_int(2)}
+    _FONTA_C = c_uint(_FONTA)
+    _SIZE0_C = c_uint(_SIZE0)
+    _FEED_C = {n: c_uint(n) for n in range(1, 11)}
+
     # Barcode maps (simplified)
     _BC_TYPE = {
         "upca": 0,
@@ -220,6 +303,9 @@ class BixolonPrinter:
         "qr-code": 12,
     }
 
+    # ECC levels given as characters, e.g. 'L' for QR codes
+    _ECC_MAP = {c: ord(c) for c in "LMQH01234567"}
+
     _ERR_MAP = {
         0: "SUCCESS",
         -99: "PORT_OPEN_ERROR",
@@ -253,6 +339,10 @@ class BixolonPrinter:
         -128: "DISABLE_BCD",
     }
 
+    # Dense tuple indexed by -code: error names resolve with one integer
+    # index instead of a dict hash on every failed call check.
+    _ERR_ARR = tuple(map(_ERR_MAP.get, range(0, -129, -1)))
+
     def __init__(self, lib_path: str = "/usr/lib/libBxlPosAPI.so.1", port: bytes = b"USB:"):
         CDLL("libbluetooth.so.3", mode=RTLD_GLOBAL)
         self.lib = CDLL(lib_path)
@@ -280,16 +370,41 @@ class BixolonPrinter:
         self.lib.RemoveNVImage.restype = c_int
         self.lib.RemoveAllNVImage.restype = c_int
 
+        # Optional memory-image API: newer libBxlPosAPI builds can print a
+        # BMP straight from a buffer, skipping the SD-card round trip that
+        # the NV-image path needs.  hasattr() probes the symbol table.
+        self._has_print_bitmap = hasattr(self.lib, "PrintBitmap")
+        if self._has_print_bitmap:
+            self.lib.PrintBitmap.argtypes = [c_char_p, c_int, c_int, c_int, c_int]
+            self.lib.PrintBitmap.restype = c_int
+
         self.port = port
         self._lock = threading.Lock()
         self._connected = False
+        self._left_margin_c = c_int(CFG.left_margin)
+        # Reused barcode struct: _print_barcode runs under self._lock, so a
+        # single zero-inited instance can be overwritten per call instead of
+        # allocating a fresh ctypes Structure for every label.
+        self._bc_info = _BarcodeInfo()
+        # Dispatch table: one dict lookup per message element instead of a
+        # chain of string compares in the job loop.
+        self._handlers = {
+            "text": self._do_text,
+            "barcode": self._do_barcode,
+            "image": self._print_image,
+        }
 
     # ---------------- connection ----------------
+    def _err_name(self, rc: int) -> str:
+        name = self._ERR_ARR[-rc] if -128 <= rc <= 0 else None
+        return name or f"unknown error {rc}"
+
     def connect(self) -> None:
         rc = self.lib.ConnectToPrinter(self.port)
         if rc != 0:
-            msg = self._ERR_MAP.get(rc, f"unknown error {rc}")
-            raise RuntimeError(f"Printer connection failed: {msg} (code {rc})")
+            raise RuntimeError(
+                f"Printer connection failed: {self._err_name(rc)} (code {rc})"
+            )
         self.lib.SetTextEncoding(0)  # ENCODING_ASCII
         self._connected = True
         LOGGER.info("Printer connected on %s", self.port.decode())
@@ -301,11 +416,14 @@ class BixolonPrinter:
 
     # ---------------- primitives ----------------
     def _txt(self, txt: str, align: str = "left") -> None:
-        if self.lib.PrintText(txt.encode(), self._ALIGN[align], self._FONTA, self._SIZE0) != 0:
+        rc = self.lib.PrintText(
+            txt.encode(), self._ALIGN_C[align], self._FONTA_C, self._SIZE0_C
+        )
+        if rc != 0:
             raise RuntimeError("PrintText failed")
 
     def _feed(self, n: int = 5) -> None:
-        self.lib.LineFeed(c_uint(n))
+        self.lib.LineFeed(self._FEED_C.get(n) or c_uint(n))
 
     def _cut(self) -> None:
         self.lib.PartialCut()
@@ -315,7 +433,8 @@ class BixolonPrinter:
         """Executes job; returns list of failed element indices."""
         failed: list[str] = []
         paper_w = job.get("paper_width", CFG.default_width)
-        self.lib.SetLeftMargin(c_int(CFG.left_margin))
+        self.lib.SetLeftMargin(self._left_margin_c)
+        handlers = self._handlers  # local alias for the hot loop
         with self._lock:
             for idx, item in enumerate(job["message"]):
                 t = "unknown"
@@ -325,17 +444,10 @@ class BixolonPrinter:
                             f"message element must be dict, got {type(item).__name__}"
                         )
                     t = item.get("type", "unknown")
-                    if t == "text":
-                        self._txt(
-                            item["content"] + "\n",
-                            item.get("alignment", "left"),
-                        )
-                    elif t == "barcode":
-                        self._print_barcode(item)
-                    elif t == "image":
-                        self._print_image(item, paper_w)
-                    else:
+                    handler = handlers.get(t)
+                    if handler is None:
                         raise ValueError(f"unknown type {t}")
+                    handler(item, paper_w)
                 except Exception as exc:  # noqa: BLE001
                     element_desc = f"type={t}"
                     if t == "text":
@@ -353,6 +465,14 @@ class BixolonPrinter:
 
     # ---------------- helpers ----------------
 
+    def _do_text(self, item: dict[str, Any], paper_w: int) -> None:
+        del paper_w  # text ignores the paper width
+        self._txt(item["content"] + "\n", item.get("alignment", "left"))
+
+    def _do_barcode(self, item: dict[str, Any], paper_w: int) -> None:
+        del paper_w  # barcode sizing comes from the spec itself
+        self._print_barcode(item)
+
     def _print_barcode(self, spec: dict[str, any]) -> None:
         """
         Specification keys:
@@ -366,25 +486,28 @@ class BixolonPrinter:
           - textPosition: int
           - attribute: int
         """
-        # prepare info struct
-        info = _BarcodeInfo()
+        # overwrite the reused info struct
+        info = self._bc_info
         info.mode = spec.get("mode", 0)
         info.height = spec.get("height", 512)
         info.width = spec.get("width", 512)
 
         ecc = spec.get("eccLevel", 0)
         # if provided as char like 'L', take its ASCII code
-        info.eccLevel = ecc if isinstance(ecc, int) else ord(ecc)
+        if isinstance(ecc, int):
+            info.eccLevel = ecc
+        else:
+            info.eccLevel = self._ECC_MAP.get(ecc) or ord(ecc)
 
         info.alignment = self._ALIGN.get(spec.get("alignment", "left"), 0)
         info.textPosition = spec.get("textPosition", 0)
         info.attribute = spec.get("attribute", 0)
 
-        # call the C function
+        # call the C function; argtypes marshal the bytes to c_char_p
         bc_type = self._BC_TYPE.get(spec.get("barcode_type", "code128"), 10)
         data = spec["content"].encode()
 
-        result = self.lib.PrintBarcode(bc_type, c_char_p(data), byref(info))
+        result = self.lib.PrintBarcode(bc_type, data, byref(info))
         if result != 0:
             raise RuntimeError(f"PrintBarcode failed with code {result}")
 
@@ -402,17 +525,40 @@ class BixolonPrinter:
         image_data = _load_image_bytes(raw_content, timeout=CFG.image_fetch_timeout)
 
         try:
-            with Image.open(io.BytesIO(image_data)) as image:
-                image.load()
-                img_rgb = image.convert("RGB")
+            # Restrict the codec probe to the formats HA actually sends
+            # instead of trying every registered Pillow plugin.
+            with Image.open(
+                io.BytesIO(image_data), formats=["PNG", "JPEG", "BMP", "GIF"]
+            ) as image:
+                # Ask the JPEG decoder for grayscale output up front, then
+                # dither to 1-bit: the printer is monochrome anyway and a
+                # 1-bit BMP is 24x smaller on the USB wire than RGB.
+                image.draft("L", image.size)
+                img_bw = image.convert("1", dither=Image.FLOYDSTEINBERG)
         except Exception as exc:
             raise ValueError("Image load/convert failed") from exc
 
+        if self._has_print_bitmap:
+            # Memory path: hand the BMP bytes to the library directly and
+            # avoid writing/reading/removing a temp file on the slow SD card.
+            buf = io.BytesIO()
+            img_bw.save(buf, format="BMP")
+            bmp = buf.getvalue()
+            alignment = self._ALIGN.get(spec.get("alignment", "left"), 0)
+            brightness = spec.get("brightness", 0)
+            rc = self.lib.PrintBitmap(
+                bmp, c_int(len(bmp)), c_int(img_bw.width),
+                c_int(alignment), c_int(brightness),
+            )
+            if rc != 0:
+                raise RuntimeError(f"PrintBitmap failed with code {rc}")
+            return
+
         key = spec.get("nv_key", 1)
         tmp_path: str | None = None
         try:
             with tempfile.NamedTemporaryFile(delete=False, suffix=".bmp") as tmpf:
-                img_rgb.save(tmpf, format="BMP")
+                img_bw.save(tmpf, format="BMP")
                 tmp_path = tmpf.name
 
             if self.lib.DownloadNVImage(tmp_path.encode(), c_ubyte(key)) != 0:
@@ -443,7 +589,17 @@ class MQTTBridge:
 
     def __init__(self, printer: BixolonPrinter, spool: RedisSpool):
         self.printer, self.spool = printer, spool
-        self.client = mqtt.Client()
+        # Stable client id + persistent session: the broker keeps the QoS 1
+        # subscriptions across reconnects instead of resubscribing (and
+        # re-sending retained discovery) on every network blip.
+        self.client = mqtt.Client(
+            client_id=f"pos-bridge-{CFG.printer_name}", clean_session=False
+        )
+        self.client.reconnect_delay_set(min_delay=1, max_delay=30)
+        # Allow bursts of acks/heartbeats to stay in flight instead of
+        # serializing on broker confirms; 0 = unbounded client-side queue.
+        self.client.max_inflight_messages_set(64)
+        self.client.max_queued_messages_set(0)
         self.client.username_pw_set(CFG.mqtt_user, CFG.mqtt_pass)
         self.client.on_connect = self._on_connect
         self.client.on_message = self._on_message
@@ -451,6 +607,8 @@ class MQTTBridge:
         self.client.message_callback_add(self.PI_UPDATE_TOPIC, self._on_pi_update)
         self.client.message_callback_add(self.RESTART_TOPIC, self._on_restart)
         self._stop = threading.Event()
+        self._queue_len_cache: tuple[float, int] = (0.0, -1)
+        self._sys_stats_cache: tuple[float, dict[str, Any]] = (0.0, {})
         self._log_handler = MQTTLogHandler(self.client, self.LOG_TOPIC, CFG.printer_name)
         self._log_handler.setLevel(getattr(logging, CFG.log_level.upper(), logging.INFO))
         LOGGER.addHandler(self._log_handler)
@@ -458,8 +616,10 @@ class MQTTBridge:
     # ---------------- public API ----------------
     def start(self):
         self.client.connect(CFG.mqtt_broker, CFG.mqtt_port)
-        threading.Thread(target=self._worker_loop, daemon=True).start()
-        threading.Thread(target=self._heartbeat_loop, daemon=True).start()
+        # One service thread handles both the spool and the heartbeat; on
+        # the single-core Pi Zero W a second thread only adds GIL and
+        # context-switch overhead (paho's network loop is the third).
+        threading.Thread(target=self._service_loop, daemon=True).start()
         self.client.loop_start()
 
     def stop(self):
@@ -489,7 +649,7 @@ class MQTTBridge:
 
     def _on_message(self, _cli, _userdata, msg):  # noqa: D401
         try:
-            payload = json.loads(msg.payload)
+            payload = _json_loads(msg.payload)
             priority = int(payload.get("priority", 5))
             self.spool.push(payload, priority)
             LOGGER.debug("Job queued: %s", payload.get("job_id"))
@@ -503,7 +663,7 @@ class MQTTBridge:
     def _on_update(self, _cli, _userdata, msg):  # noqa: D401
         """Handle update commands."""
         try:
-            payload = json.loads(msg.payload) if msg.payload else {}
+            payload = _json_loads(msg.payload) if msg.payload else {}
             version = str(payload.get("version", "")).strip()
             threading.Thread(
                 target=self._perform_bridge_update,
@@ -576,9 +736,21 @@ class MQTTBridge:
             LOGGER.error("Failed to execute reboot: %s", exc, exc_info=True)
 
     # ---------------- worker ----------------
-    def _worker_loop(self):
+    def _service_loop(self):
+        """Drain the spool and emit heartbeats from a single thread.
+
+        The blocking spool pop doubles as the heartbeat timer: its timeout
+        is clamped so the next beat is never late by more than a second.
+        """
+        next_beat = 0.0
         while not self._stop.is_set():
-            job = self.spool.pop(timeout=5)
+            now = time.monotonic()
+            if now >= next_beat:
+                self._publish_bridge_announcement()
+                self._publish_heartbeat()
+                next_beat = now + CFG.heartbeat_interval
+            timeout = max(1, min(5, int(next_beat - now)))
+            job = self.spool.pop(timeout=timeout)
             if not job:
                 continue
             job_id = job.get("job_id", f"ts{int(time.time()*1000)}")
@@ -590,44 +762,58 @@ class MQTTBridge:
                 status, detail = "error", str(exc)
             self._publish_ack(job_id, status, detail)
 
-    # ---------------- heartbeat ----------------
-    def _heartbeat_loop(self):
-        while not self._stop.is_set():
-            self._publish_bridge_announcement()
-            self._publish_heartbeat()
-            time.sleep(CFG.heartbeat_interval)
-
     # ---------------- helpers ----------------
+    def _queue_length(self) -> int:
+        """Spool length with a 1 s cache so ack bursts skip redundant ZCARDs."""
+        now = time.monotonic()
+        ts, value = self._queue_len_cache
+        if value < 0 or now - ts > 1.0:
+            value = self.spool.length()
+            self._queue_len_cache = (now, value)
+        return value
+
     def _publish_ack(self, job_id: str, status: str, detail: str):
         payload = {
             "job_id": job_id,
             "status": status,
             "detail": detail,
-            "queue_len": self.spool.length(),
+            "queue_len": self._queue_length(),
             "printer_status": self.printer.get_status(),
             "timestamp": int(time.time()),
         }
-        self.client.publish(self.PUB_TOPIC, json.dumps(payload), qos=1)
+        self.client.publish(self.PUB_TOPIC, _json_dumps(payload), qos=1)
 
     def _publish_heartbeat(self):
         info: Dict[str, Any] = {
             "timestamp": int(time.time()),
-            "queue_len": self.spool.length(),
+            "queue_len": self._queue_length(),
             "printer_status": self.printer.get_status(),
             "version": BRIDGE_VERSION,
         }
+        info.update(self._system_stats())
+        self.client.publish(self.PUB_TOPIC, _json_dumps({"heartbeat": info}), qos=0, retain=False)
+
+    def _system_stats(self) -> dict[str, Any]:
+        """System probes for the heartbeat, refreshed at most every 5 s.
+
+        Temperatures and memory move on second-scale timescales, so the
+        sysfs/psutil reads are cached instead of hitting /sys and /proc on
+        every beat.
+        """
+        ts, stats = self._sys_stats_cache
+        now = time.monotonic()
+        if stats and now - ts < 5.0:
+            return stats
+        stats = {"cpu_temp": _read_cpu_temp()}
         if psutil:
-            info.update({
-                "cpu_temp": psutil.sensors_temperatures()["cpu-thermal"][0].current  # type: ignore[index]
-                if "cpu-thermal" in psutil.sensors_temperatures() else None,
-                "cpu_percent": psutil.cpu_percent(interval=None),
-                "mem_available": psutil.virtual_memory().available,
-            })
-        self.client.publish(self.PUB_TOPIC, json.dumps({"heartbeat": info}), qos=0, retain=False)
+            stats["cpu_percent"] = psutil.cpu_percent(interval=None)
+            stats["mem_available"] = psutil.virtual_memory().available
+        self._sys_stats_cache = (now, stats)
+        return stats
 
     def _publish_bridge_announcement(self):
         payload = {"printer_name": CFG.printer_name}
-        self.client.publish("pos_printer/discovery", json.dumps(payload), qos=1, retain=True)
+        self.client.publish("pos_printer/discovery", _json_dumps(payload), qos=1, retain=True)
 
     def _publish_discovery(self):
         base = f"homeassistant/sensor/{CFG.printer_name}"
@@ -656,7 +842,7 @@ class MQTTBridge:
         }
         for s, cfg in sensors.items():
             topic = f"{base}/{s}/config"
-            self.client.publish(topic, json.dumps(cfg), qos=1, retain=True)
+            self.client.publish(topic, _json_dumps(cfg), qos=1, retain=True)
 
 # --------------------------- 5. Main ------------------------------------
 
@@ -14,7 +14,12 @@ setup(
         "python-dotenv",
         "Pillow",
         "psutil",
+        "pybase64",
     ],
+    extras_require={
+        # orjson has no ARMv6 wheels; the bridge falls back to stdlib json.
+        "speed": ["orjson"],
+    },
     entry_points={
         "console_scripts": [
             "printer-bridge=printer_bridge:main",
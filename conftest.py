@@ -0,0 +1,34 @@
+"""Root test configuration: stub out the MQTT integration early.
+
+This runs before the custom_components package is imported for test
+collection.  Loading the real homeassistant.components.mqtt module pulls
+in the whole MQTT client stack and dominates the suite's cold-start
+time, so a stub module with the three coroutines the component uses is
+injected instead; fixtures patch its attributes exactly as they would on
+the genuine module.
+"""
+
+import sys
+import types
+
+import homeassistant.components
+
+
+async def _noop_publish(hass, topic, payload, qos):
+    return
+
+
+async def _noop_wait_for_client(hass):
+    return
+
+
+async def _noop_subscribe(hass, topic, callback):
+    return lambda: None
+
+
+mqtt = types.ModuleType("homeassistant.components.mqtt")
+mqtt.async_publish = _noop_publish
+mqtt.async_wait_for_mqtt_client = _noop_wait_for_client
+mqtt.async_subscribe = _noop_subscribe
+sys.modules["homeassistant.components.mqtt"] = mqtt
+homeassistant.components.mqtt = mqtt
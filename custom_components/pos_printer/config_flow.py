@@ -7,6 +7,12 @@ STEP_USER_DATA_SCHEMA = vol.Schema({
     vol.Required(CONF_PRINTER_NAME, default="kitchen_printer"): str,
 })
 
+# Built once at import; per-entry defaults are supplied as suggested values
+# instead of recompiling a Schema on every options dialog open.
+OPTIONS_SCHEMA = vol.Schema({
+    vol.Required(CONF_PRINTER_NAME): str,
+})
+
 class PosPrinterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for POS-Printer Bridge."""
 
@@ -69,15 +75,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         # Set defaults from existing entry data and options
         current_data = self.config_entry.data
         current_options = self.config_entry.options
-
-        data_schema = vol.Schema({
-            vol.Required(
-                CONF_PRINTER_NAME,
-                default=current_options.get(CONF_PRINTER_NAME, current_data.get(CONF_PRINTER_NAME)),
-            ): str,
-        })
+        suggested = {
+            CONF_PRINTER_NAME: current_options.get(
+                CONF_PRINTER_NAME, current_data.get(CONF_PRINTER_NAME)
+            ),
+        }
 
         return self.async_show_form(
             step_id="init",
-            data_schema=data_schema,
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, suggested
+            ),
         )
@@ -1,9 +1,20 @@
 DOMAIN = "pos_printer"
 CONF_PRINTER_NAME = "printer_name"
 
-import json
+import functools
 from pathlib import Path
 
-with open(Path(__file__).with_name("manifest.json"), "r", encoding="utf-8") as _f:
-    VERSION = json.load(_f)["version"]
+import orjson
 
+
+@functools.cache
+def _manifest() -> dict:
+    """Load manifest.json once per process, even across dev reloads.
+
+    read_bytes() skips the text decoder; orjson parses bytes directly.
+    orjson ships with Home Assistant core, so no extra requirement.
+    """
+    return orjson.loads(Path(__file__).with_name("manifest.json").read_bytes())
+
+
+VERSION = _manifest()["version"]
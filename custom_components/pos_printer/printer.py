@@ -2,26 +2,58 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import logging
-import uuid
-from datetime import date, datetime
+import secrets
+import sys
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.components import mqtt
+from homeassistant.const import MATCH_ALL
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.json import json_loads
 
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bridge log level names resolved once; avoids a getattr on the logging
+# module (and its failure fallback) for every bridge log message.  The
+# WARN/FATAL aliases exist on the logging module and must stay accepted.
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "FATAL": logging.CRITICAL,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_json_cached(raw: str) -> Any:
+    """Parse a JSON service-field string, memoized for repeated templates.
+
+    Automations often fire byte-identical job strings; the cache turns the
+    repeat parses into dict lookups.  Results must be treated read-only by
+    callers - handle_print copies the job dict before mutating it.
+    """
+    return json_loads(raw)
+
 
 def _parse_json_if_needed(value: Any, field_name: str) -> Any:
     """Parse JSON strings used in service fields."""
     if isinstance(value, str):
         try:
-            return json.loads(value)
+            return _parse_json_cached(value)
         except json.JSONDecodeError as err:
             raise HomeAssistantError(
                 f"Field '{field_name}' must contain valid JSON."
@@ -39,11 +71,49 @@ def _coerce_message(value: Any) -> list[dict[str, Any]] | None:
     return message
 
 
-def _coerce_datetime(value: Any) -> Any:
-    """Convert datetime/date values to strings for JSON payloads."""
-    if isinstance(value, (datetime, date)):
-        return value.isoformat()
-    return value
+# GUI-field to job-element key tables: the service schema is constant, so
+# encode it as data instead of per-key if-ladders in the builders.
+_TEXT_FIELDS = (
+    ("text_alignment", "alignment"),
+    ("text_font", "font"),
+    ("text_size", "size"),
+)
+_TEXT_FLAGS = (
+    ("text_bold", "bold"),
+    ("text_underline", "underline"),
+    ("text_italic", "italic"),
+    ("text_double_height", "double_height"),
+)
+_BARCODE_FIELDS = (
+    ("barcode_height", "height"),
+    ("barcode_width", "width"),
+    ("barcode_ecc_level", "eccLevel"),
+    ("barcode_mode", "mode"),
+    ("barcode_alignment", "alignment"),
+    ("barcode_text_position", "textPosition"),
+    ("barcode_attribute", "attribute"),
+)
+_IMAGE_FIELDS = (
+    ("image_alignment", "alignment"),
+    ("image_nv_key", "nv_key"),
+)
+
+
+def _apply_fields(
+    element: dict[str, Any],
+    data: dict[str, Any],
+    fields: tuple[tuple[str, str], ...],
+    flags: tuple[tuple[str, str], ...] = (),
+) -> dict[str, Any]:
+    """Copy the GUI fields present in data into a job element."""
+    get = data.get
+    element.update(
+        (dst, value)
+        for src, dst in fields
+        if (value := get(src)) is not None
+    )
+    element.update((dst, True) for src, dst in flags if get(src))
+    return element
 
 
 def _build_text_element(data: dict[str, Any]) -> dict[str, Any] | None:
@@ -51,24 +121,9 @@ def _build_text_element(data: dict[str, Any]) -> dict[str, Any] | None:
     content = data.get("text_content")
     if content in (None, ""):
         return None
-
-    element: dict[str, Any] = {"type": "text", "content": content}
-
-    if (alignment := data.get("text_alignment")) is not None:
-        element["alignment"] = alignment
-    if data.get("text_bold"):
-        element["bold"] = True
-    if data.get("text_underline"):
-        element["underline"] = True
-    if data.get("text_italic"):
-        element["italic"] = True
-    if data.get("text_double_height"):
-        element["double_height"] = True
-    if (font := data.get("text_font")) is not None:
-        element["font"] = font
-    if (size := data.get("text_size")) is not None:
-        element["size"] = size
-    return element
+    return _apply_fields(
+        {"type": "text", "content": content}, data, _TEXT_FIELDS, _TEXT_FLAGS
+    )
 
 
 def _build_text_line_elements(data: dict[str, Any]) -> list[dict[str, Any]]:
@@ -81,26 +136,12 @@ def _build_text_line_elements(data: dict[str, Any]) -> list[dict[str, Any]]:
     if not any(line.strip() for line in lines):
         return []
 
-    elements: list[dict[str, Any]] = []
-    for line in lines:
-        content = line if line else " "
-        element: dict[str, Any] = {"type": "text", "content": content}
-        if (alignment := data.get("text_alignment")) is not None:
-            element["alignment"] = alignment
-        if data.get("text_bold"):
-            element["bold"] = True
-        if data.get("text_underline"):
-            element["underline"] = True
-        if data.get("text_italic"):
-            element["italic"] = True
-        if data.get("text_double_height"):
-            element["double_height"] = True
-        if (font := data.get("text_font")) is not None:
-            element["font"] = font
-        if (size := data.get("text_size")) is not None:
-            element["size"] = size
-        elements.append(element)
-    return elements
+    # Shared attributes are computed once instead of per line.
+    attrs = _apply_fields({}, data, _TEXT_FIELDS, _TEXT_FLAGS)
+    return [
+        {"type": "text", "content": line if line else " ", **attrs}
+        for line in lines
+    ]
 
 
 def _build_barcode_element(data: dict[str, Any]) -> dict[str, Any] | None:
@@ -108,28 +149,12 @@ def _build_barcode_element(data: dict[str, Any]) -> dict[str, Any] | None:
     content = data.get("barcode_content")
     if content in (None, ""):
         return None
-
     element: dict[str, Any] = {
         "type": "barcode",
         "content": content,
         "barcode_type": data.get("barcode_type") or "code128",
     }
-
-    if (height := data.get("barcode_height")) is not None:
-        element["height"] = height
-    if (width := data.get("barcode_width")) is not None:
-        element["width"] = width
-    if (ecc_level := data.get("barcode_ecc_level")) is not None:
-        element["eccLevel"] = ecc_level
-    if (mode := data.get("barcode_mode")) is not None:
-        element["mode"] = mode
-    if (alignment := data.get("barcode_alignment")) is not None:
-        element["alignment"] = alignment
-    if (text_position := data.get("barcode_text_position")) is not None:
-        element["textPosition"] = text_position
-    if (attribute := data.get("barcode_attribute")) is not None:
-        element["attribute"] = attribute
-    return element
+    return _apply_fields(element, data, _BARCODE_FIELDS)
 
 
 def _build_image_element(data: dict[str, Any]) -> dict[str, Any] | None:
@@ -137,17 +162,46 @@ def _build_image_element(data: dict[str, Any]) -> dict[str, Any] | None:
     content = data.get("image_content")
     if content in (None, ""):
         return None
+    return _apply_fields(
+        {"type": "image", "content": content}, data, _IMAGE_FIELDS
+    )
 
-    element: dict[str, Any] = {"type": "image", "content": content}
-    if (alignment := data.get("image_alignment")) is not None:
-        element["alignment"] = alignment
-    if (nv_key := data.get("image_nv_key")) is not None:
-        element["nv_key"] = nv_key
-    return element
+
+# Compiled once at import and handed to async_register, so HA validates
+# the call shape before the handler runs; the checks inside the handler
+# only cover content parsed out of JSON strings, which a service schema
+# cannot see.  ALLOW_EXTRA admits the GUI builder fields.
+SERVICE_PRINT_SCHEMA = vol.Schema(
+    {
+        vol.Optional("printer_name"): cv.string,
+        vol.Optional("job"): vol.Any(dict, cv.string),
+        vol.Optional("message"): vol.Any(list, cv.string),
+        vol.Optional("job_id"): cv.string,
+        vol.Optional("priority"): vol.All(vol.Coerce(int), vol.Range(min=0, max=9)),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+SERVICE_PRINT_BATCH_SCHEMA = vol.Schema(
+    {
+        vol.Optional("printer_name"): cv.string,
+        vol.Required("jobs"): vol.All(cv.ensure_list, [vol.Any(dict, cv.string)]),
+    }
+)
+
+# Optional job fields merged from call data over job-template values.
+_OPTIONAL_FIELDS = ("paper_width", "feed_after", "expires", "timestamp")
+
+# Keys whose presence means the call uses GUI mode at all.
+_GUI_TRIGGER_KEYS = frozenset(
+    ("text_content", "text_lines", "barcode_content", "image_content")
+)
 
 
 def _build_message_from_gui_fields(data: dict[str, Any]) -> list[dict[str, Any]]:
     """Create message list from dedicated GUI fields."""
+    if _GUI_TRIGGER_KEYS.isdisjoint(data):
+        return []
     message: list[dict[str, Any]] = []
     if element := _build_text_element(data):
         message.append(element)
@@ -158,19 +212,92 @@ def _build_message_from_gui_fields(data: dict[str, Any]) -> list[dict[str, Any]]
     return message
 
 
-def _resolve_target_printer(
+# Event names are constant per domain; shared by all printer callbacks.
+_STATUS_EVENT = f"{DOMAIN}.status"
+_LOG_EVENT = f"{DOMAIN}.bridge_log"
+
+
+@callback
+def _handle_status(hass: HomeAssistant, printer_name: str, msg: Any) -> None:
+    """Forward a bridge status payload to the HA event bus."""
+    raw = msg.payload
+    # Bridge acks always carry "status" and heartbeats "heartbeat" or
+    # "version"; a payload with none of them cannot update any entity,
+    # so the substring probe skips the full JSON parse for it.
+    if "status" not in raw and "heartbeat" not in raw and "version" not in raw:
+        return
+    try:
+        payload = json_loads(raw)
+        # A non-dict root raises TypeError on the key assignment, which
+        # the broad except below turns into the same logged error - no
+        # explicit isinstance on the hot path.
+        payload["printer_name"] = printer_name
+    except json.JSONDecodeError:
+        return
+    except (TypeError, ValueError):
+        _LOGGER.exception("Error handling status payload")
+        return
+    # Firing allocates an Event and walks the listener list; skip it
+    # when nothing subscribed to the status event.  MATCH_ALL counts too:
+    # the recorder and dev-tools subscribe to every event type.
+    listeners = hass.bus.async_listeners()
+    if listeners.get(_STATUS_EVENT) or listeners.get(MATCH_ALL):
+        hass.bus.async_fire(_STATUS_EVENT, payload)
+
+
+@callback
+def _handle_bridge_log(hass: HomeAssistant, printer_name: str, msg: Any) -> None:
+    """Relay a bridge log payload to the HA event bus and logger."""
+    try:
+        payload = json_loads(msg.payload)
+    except json.JSONDecodeError:
+        return
+    except (TypeError, ValueError):
+        _LOGGER.exception("Error handling bridge log payload")
+        return
+
+    if not isinstance(payload, dict):
+        return
+
+    payload.setdefault("printer_name", printer_name)
+    listeners = hass.bus.async_listeners()
+    if listeners.get(_LOG_EVENT) or listeners.get(MATCH_ALL):
+        hass.bus.async_fire(_LOG_EVENT, payload)
+
+    # The bridge emits canonical upper-case names, so try the raw value
+    # before paying for .upper() on every message.
+    raw_level = payload.get("level")
+    level = _LEVELS.get(raw_level) if isinstance(raw_level, str) else None
+    if level is None:
+        level = (
+            _LEVELS.get(raw_level.upper(), logging.INFO)
+            if isinstance(raw_level, str)
+            else logging.INFO
+        )
+    if _LOGGER.isEnabledFor(level):
+        logger_name = str(payload.get("logger", "printer_bridge"))
+        message = str(payload.get("message", ""))
+        _LOGGER.log(level, "Bridge log [%s]: %s", logger_name, message)
+
+
+def _resolve_target_record(
     call: ServiceCall,
-    printers: dict[str, dict[str, Any]],
-) -> str:
-    """Resolve the printer target for a service call."""
+    data: dict[str, Any],
+) -> dict[str, Any]:
+    """Resolve the per-printer record for a service call.
+
+    Returns the record itself so callers hash the target name once
+    instead of re-indexing the printers dict.  The single-printer case -
+    by far the most common install - is one cached dict get.
+    """
     target = call.data.get("printer_name")
     if target:
-        if target not in printers:
+        if (record := data["printers"].get(target)) is None:
             raise HomeAssistantError(f"Unknown printer '{target}'.")
-        return target
+        return record
 
-    if len(printers) == 1:
-        return next(iter(printers))
+    if (record := data.get("default_printer")) is not None:
+        return record
 
     raise HomeAssistantError(
         "Field 'printer_name' is required when multiple printers are configured."
@@ -184,31 +311,50 @@ async def setup_print_service(hass: HomeAssistant, config: dict[str, Any]) -> No
     data = hass.data.setdefault(DOMAIN, {})
     printers: dict[str, dict[str, Any]] = data.setdefault("printers", {})
 
-    printer_name: str = config["printer_name"]
+    # Interned so every later lookup of this key hashes a shared object.
+    printer_name: str = sys.intern(config["printer_name"])
     print_topic = f"print/pos/{printer_name}/job"
     status_topic = f"print/pos/{printer_name}/ack"
     log_topic = f"print/pos/{printer_name}/log"
 
-    if printer_name in printers:
-        existing = printers.pop(printer_name)
-        if (unsub_status := existing.get("unsub_status")):
-            unsub_status()
-        if (unsub_log := existing.get("unsub_log")):
-            unsub_log()
+    # Reuse the record on re-setup (reload) instead of pop + re-insert.
+    existing = printers.get(printer_name)
+    if existing:
+        for key in ("unsub_status", "unsub_log"):
+            if (unsub := existing.get(key)):
+                unsub()
 
     if not data.get("service_registered"):
 
         async def handle_print(call: ServiceCall) -> None:
             """Send print data via MQTT to the selected printer."""
-            target = _resolve_target_printer(call, printers)
-            publish_topic: str = printers[target]["print_topic"]
+            record = _resolve_target_record(call, data)
+            publish_topic: str = record["print_topic"]
 
             job_data: dict[str, Any] | None = None
             message = _coerce_message(call.data.get("message"))
             if (raw_job := call.data.get("job")) is not None:
                 parsed_job = _parse_json_if_needed(raw_job, "job")
+                # Fast path: a complete templated job string with no other
+                # fields to merge can be forwarded verbatim, skipping the
+                # re-serialization (the parse above is LRU-cached).
+                if (
+                    isinstance(raw_job, str)
+                    and isinstance(parsed_job, dict)
+                    and set(call.data) <= {"job", "printer_name"}
+                    and "job_id" in parsed_job
+                    and "priority" in parsed_job
+                    and isinstance(parsed_job.get("message"), list)
+                ):
+                    await mqtt.async_publish(
+                        hass, topic=publish_topic, payload=raw_job, qos=1
+                    )
+                    return
                 if not isinstance(parsed_job, dict):
                     raise HomeAssistantError("Field 'job' must be an object.")
+                # The copy is load-bearing: parsed strings come from the
+                # shared LRU cache and parsed dicts are owned by the caller,
+                # and job_data is mutated below.
                 job_data = dict(parsed_job)
 
             if message is None and job_data is not None:
@@ -223,77 +369,108 @@ async def setup_print_service(hass: HomeAssistant, config: dict[str, Any]) -> No
                         "'text_content', 'barcode_content', or 'image_content'."
                     )
 
+            call_data = call.data
             payload: dict[str, Any] = dict(job_data or {})
             payload["job_id"] = (
-                call.data.get("job_id")
+                call_data.get("job_id")
                 or payload.get("job_id")
-                or uuid.uuid4().hex
+                or secrets.token_hex(16)
             )
-            payload["priority"] = call.data.get("priority", payload.get("priority", 5))
+            payload["priority"] = call_data.get("priority", payload.get("priority", 5))
             payload["message"] = message
 
-            for field in ("paper_width", "feed_after", "expires", "timestamp"):
-                value = call.data.get(field)
-                if value is None:
-                    value = payload.get(field)
-                if value is not None:
-                    payload[field] = _coerce_datetime(value)
+            # One fused update; datetime/date values are serialized by
+            # json_dumps itself (isoformat), so no per-field coercion.
+            payload.update(
+                (field, value)
+                for field in _OPTIONAL_FIELDS
+                if (value := call_data.get(field)) is not None
+            )
+
+            # Image elements embed base64 blobs large enough for the
+            # encode to block the loop for milliseconds; push those to
+            # the executor and keep small text jobs inline.
+            if any(
+                isinstance(element, dict) and element.get("type") == "image"
+                for element in message
+            ):
+                encoded = await hass.async_add_executor_job(json_dumps, payload)
+            else:
+                encoded = json_dumps(payload)
 
             await mqtt.async_publish(
                 hass,
                 topic=publish_topic,
-                payload=json.dumps(payload),
+                payload=encoded,
                 qos=1,
             )
 
+        async def handle_print_batch(call: ServiceCall) -> None:
+            """Publish a list of complete jobs with one gathered round-trip."""
+            record = _resolve_target_record(call, data)
+            publish_topic: str = record["print_topic"]
+
+            payloads: list[str] = []
+            for raw_job in call.data["jobs"]:
+                job = _parse_json_if_needed(raw_job, "jobs")
+                if not isinstance(job, dict):
+                    raise HomeAssistantError(
+                        "Each entry in 'jobs' must be an object."
+                    )
+                job = dict(job)
+                message = _coerce_message(job.get("message"))
+                if not message:
+                    raise HomeAssistantError(
+                        "Each entry in 'jobs' needs a non-empty 'message' list."
+                    )
+                job["message"] = message
+                job.setdefault("job_id", secrets.token_hex(16))
+                job.setdefault("priority", 5)
+                payloads.append(json_dumps(job))
+
+            # All payloads are built before the first publish, so one bad
+            # job aborts the batch instead of printing half of it; the
+            # publishes then share the event-loop round-trip.
+            await asyncio.gather(
+                *(
+                    mqtt.async_publish(hass, topic=publish_topic, payload=p, qos=1)
+                    for p in payloads
+                )
+            )
+
         if hass.services.has_service(DOMAIN, "print_job"):
             hass.services.async_remove(DOMAIN, "print_job")
-        hass.services.async_register(DOMAIN, "print", handle_print)
+        hass.services.async_register(
+            DOMAIN, "print", handle_print, schema=SERVICE_PRINT_SCHEMA
+        )
+        hass.services.async_register(
+            DOMAIN, "print_batch", handle_print_batch, schema=SERVICE_PRINT_BATCH_SCHEMA
+        )
         data["service_registered"] = True
 
-    @callback
-    def handle_status(msg: Any) -> None:
-        try:
-            payload = json.loads(msg.payload)
-            if not isinstance(payload, dict):
-                raise TypeError("Status payload must be a JSON object")
-            payload["printer_name"] = printer_name
-        except json.JSONDecodeError:
-            return
-        except Exception:  # noqa: BLE001
-            _LOGGER.exception("Error handling status payload")
-            return
-        hass.bus.async_fire(f"{DOMAIN}.status", payload)
-
-    @callback
-    def handle_bridge_log(msg: Any) -> None:
-        try:
-            payload = json.loads(msg.payload)
-        except json.JSONDecodeError:
-            return
-        except Exception:  # noqa: BLE001
-            _LOGGER.exception("Error handling bridge log payload")
-            return
-
-        if not isinstance(payload, dict):
-            return
-
-        payload.setdefault("printer_name", printer_name)
-        hass.bus.async_fire(f"{DOMAIN}.bridge_log", payload)
-
-        level_name = str(payload.get("level", "INFO")).upper()
-        level = getattr(logging, level_name, logging.INFO)
-        logger_name = str(payload.get("logger", "printer_bridge"))
-        message = str(payload.get("message", ""))
-        _LOGGER.log(level, "Bridge log [%s]: %s", logger_name, message)
+    # Module-level handlers bound with partial: one shared code object for
+    # all printers instead of per-printer closures (and their ref cycles).
+    status_cb = functools.partial(_handle_status, hass, printer_name)
+    log_cb = functools.partial(_handle_bridge_log, hass, printer_name)
 
-    unsub_status = await mqtt.async_subscribe(hass, status_topic, handle_status)
-    unsub_log = await mqtt.async_subscribe(hass, log_topic, handle_bridge_log)
-    printers[printer_name] = {
-        "print_topic": print_topic,
-        "unsub_status": unsub_status,
-        "unsub_log": unsub_log,
-    }
+    # The two subscribes are independent; run the round-trips concurrently.
+    unsub_status, unsub_log = await asyncio.gather(
+        mqtt.async_subscribe(hass, status_topic, status_cb),
+        mqtt.async_subscribe(hass, log_topic, log_cb),
+    )
+    record = existing if existing is not None else printers.setdefault(
+        printer_name, {}
+    )
+    record.update(
+        print_topic=print_topic,
+        unsub_status=unsub_status,
+        unsub_log=unsub_log,
+    )
+    # Kept in sync on setup/unload so the resolver's no-target path is a
+    # single dict get instead of a len() + iter() per call.
+    data["default_printer"] = (
+        next(iter(printers.values())) if len(printers) == 1 else None
+    )
 
 
 async def unload_print_service(hass: HomeAssistant, config: dict[str, Any]) -> None:
@@ -312,9 +489,12 @@ async def unload_print_service(hass: HomeAssistant, config: dict[str, Any]) -> N
         if (unsub_log := info.get("unsub_log")):
             unsub_log()
 
+    data["default_printer"] = (
+        next(iter(printers.values())) if len(printers) == 1 else None
+    )
+
     if not printers:
-        if hass.services.has_service(DOMAIN, "print"):
-            hass.services.async_remove(DOMAIN, "print")
-        if hass.services.has_service(DOMAIN, "print_job"):
-            hass.services.async_remove(DOMAIN, "print_job")
+        for service in ("print", "print_batch", "print_job"):
+            if hass.services.has_service(DOMAIN, service):
+                hass.services.async_remove(DOMAIN, service)
         hass.data.pop(DOMAIN, None)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 from datetime import datetime, timezone
+import functools
 import logging
 from typing import Callable
 
@@ -15,30 +16,109 @@ from .const import DOMAIN, VERSION
 
 _LOGGER = logging.getLogger(__name__)
 
+# Event names are constant; build them once instead of per listener.
+_STATUS_EVENT = f"{DOMAIN}.status"
+_LOG_EVENT = f"{DOMAIN}.bridge_log"
+
+
+@functools.lru_cache(maxsize=None)
+def _device_info_for(printer_name: str) -> dict:
+    """Return the shared device-info dict for a printer.
+
+    All entities of one printer point at the same mapping instead of
+    carrying per-instance copies.
+    """
+    return {
+        "identifiers": {(DOMAIN, printer_name)},
+        "name": printer_name,
+        "manufacturer": "Bixolon",
+        "model": "POS Printer Bridge",
+        "sw_version": VERSION,
+    }
+
+
+class _StatusDispatcher:
+    """Route status events to entities, keyed by printer name.
+
+    One bus listener per hass instance instead of one per entity: the
+    printer_name filter runs once per event, and every subscribed entity
+    receives the already-extracted data dict.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._subscribers: dict[str, list[PosPrinterEntity]] = {}
+        self._unsub: Callable[[], None] | None = None
+
+    def subscribe(self, entity: PosPrinterEntity) -> Callable[[], None]:
+        """Register an entity; returns an unsubscribe callable."""
+        subs = self._subscribers.setdefault(entity._printer_name, [])
+        subs.append(entity)
+        if self._unsub is None:
+            # The filter runs inside the event bus, so events for
+            # unknown printers never schedule the callback at all.
+            self._unsub = self._hass.bus.async_listen(
+                _STATUS_EVENT, self._dispatch, event_filter=self._filter
+            )
+
+        def _remove() -> None:
+            subs.remove(entity)
+            if not any(self._subscribers.values()) and self._unsub:
+                self._unsub()
+                self._unsub = None
+
+        return _remove
+
+    @callback
+    def _filter(self, event_data: dict) -> bool:
+        return event_data.get("printer_name") in self._subscribers
+
+    @callback
+    def _dispatch(self, event: Event) -> None:
+        data = event.data
+        entities = self._subscribers.get(data.get("printer_name"))
+        if entities:
+            for entity in list(entities):
+                entity._apply_status(data)
+
+
+def _get_dispatcher(hass: HomeAssistant) -> _StatusDispatcher:
+    """Return the per-hass status dispatcher, creating it on first use."""
+    data = hass.data.setdefault(DOMAIN, {})
+    dispatcher = data.get("status_dispatcher")
+    if dispatcher is None:
+        dispatcher = data["status_dispatcher"] = _StatusDispatcher(hass)
+    return dispatcher
+
 
 class PosPrinterEntity:
     """Base class with common device info."""
 
+    # HA's Entity still provides a __dict__ for the _attr_* machinery;
+    # slotting our own hot attributes gives them descriptor-speed access.
+    __slots__ = ("_printer_name", "_entry_id", "_unsub")
+
     _attr_has_entity_name = True
 
     def __init__(self, printer_name: str, entry_id: str) -> None:
         self._printer_name = printer_name
         self._entry_id = entry_id
         self._unsub: Callable[[], None] | None = None
+        # HA reads the attribute directly; the dict itself is shared by
+        # every entity of the same printer.
+        self._attr_device_info = _device_info_for(printer_name)
+
+    async def async_added_to_hass(self) -> None:
+        self._unsub = _get_dispatcher(self.hass).subscribe(self)
 
     async def async_will_remove_from_hass(self) -> None:
-        if self._unsub:
+        if self._unsub is not None:
             self._unsub()
+            self._unsub = None
 
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._printer_name)},
-            "name": self._printer_name,
-            "manufacturer": "Bixolon",
-            "model": "POS Printer Bridge",
-            "sw_version": VERSION,
-        }
+    @callback
+    def _apply_status(self, data: dict) -> None:
+        """Handle a status event payload already filtered to this printer."""
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -65,6 +145,8 @@ async def async_setup_entry(
 class LastJobStatusSensor(PosPrinterEntity, SensorEntity):
     """Sensor for the status of the last print job."""
 
+    __slots__ = ("_state",)
+
     _attr_translation_key = "last_job_status"
     _attr_translation_domain = DOMAIN
     _attr_icon = "mdi:printer-3d-check"
@@ -79,18 +161,10 @@ class LastJobStatusSensor(PosPrinterEntity, SensorEntity):
     def native_value(self) -> str | None:
         return self._state
 
-    async def async_added_to_hass(self) -> None:
-        # Listen to our custom status events
-        self._unsub = self.hass.bus.async_listen(
-            f"{DOMAIN}.status", self._handle_event
-        )
-
     @callback
-    def _handle_event(self, event: Event) -> None:
-        if event.data.get("printer_name") != self._printer_name:
-            return
-        status = event.data.get("status")
-        if status is not None:
+    def _apply_status(self, data: dict) -> None:
+        status = data.get("status")
+        if status is not None and status != self._state:
             self._state = status
             if self.hass and self.entity_id:
                 self.async_write_ha_state()
@@ -99,6 +173,8 @@ class LastJobStatusSensor(PosPrinterEntity, SensorEntity):
 class LastJobIdSensor(PosPrinterEntity, SensorEntity):
     """Sensor for the ID of the last print job."""
 
+    __slots__ = ("_state",)
+
     _attr_translation_key = "last_job_id"
     _attr_translation_domain = DOMAIN
     _attr_icon = "mdi:identifier"
@@ -113,17 +189,10 @@ class LastJobIdSensor(PosPrinterEntity, SensorEntity):
     def native_value(self) -> str | None:
         return self._state
 
-    async def async_added_to_hass(self) -> None:
-        self._unsub = self.hass.bus.async_listen(
-            f"{DOMAIN}.status", self._handle_event
-        )
-
     @callback
-    def _handle_event(self, event: Event) -> None:
-        if event.data.get("printer_name") != self._printer_name:
-            return
-        job_id = event.data.get("job_id")
-        if job_id is not None:
+    def _apply_status(self, data: dict) -> None:
+        job_id = data.get("job_id")
+        if job_id is not None and job_id != self._state:
             self._state = job_id
             if self.hass and self.entity_id:
                 self.async_write_ha_state()
@@ -133,6 +202,8 @@ class LastJobIdSensor(PosPrinterEntity, SensorEntity):
 class LastStatusTimestampSensor(PosPrinterEntity, SensorEntity):
     """Sensor for the timestamp of the last status update."""
 
+    __slots__ = ("_dt",)
+
     _attr_translation_key = "last_status_update"
     _attr_translation_domain = DOMAIN
     _attr_icon = "mdi:clock-outline"
@@ -142,79 +213,86 @@ class LastStatusTimestampSensor(PosPrinterEntity, SensorEntity):
         super().__init__(printer_name, entry_id)
         self._attr_name = f"{printer_name} Last Status Update"
         self._attr_unique_id = f"{entry_id}_last_status_update"
-        self._timestamp: int | None = None
+        # Converted once on update; HA and template renders may read
+        # native_value several times per state write.
+        self._dt: datetime | None = None
 
     @property
     def native_value(self) -> datetime | None:
-        if self._timestamp is None:
-            return None
-        # Home Assistant expects timezone-aware datetimes
-        return datetime.fromtimestamp(self._timestamp, tz=timezone.utc)
-
-    async def async_added_to_hass(self) -> None:
-        self._unsub = self.hass.bus.async_listen(
-            f"{DOMAIN}.status", self._handle_event
-        )
+        return self._dt
 
     @callback
-    def _handle_event(self, event: Event) -> None:
-        if event.data.get("printer_name") != self._printer_name:
-            return
-        ts = event.data.get("timestamp")
+    def _apply_status(self, data: dict) -> None:
+        ts = data.get("timestamp")
         if isinstance(ts, (int, float)):
-            self._timestamp = ts
-            if self.hass and self.entity_id:
-                self.async_write_ha_state()
+            # Home Assistant expects timezone-aware datetimes
+            dt = datetime.fromtimestamp(ts, tz=timezone.utc)
+            if dt != self._dt:
+                self._dt = dt
+                if self.hass and self.entity_id:
+                    self.async_write_ha_state()
             
             
 class JobErrorBinarySensor(PosPrinterEntity, BinarySensorEntity):
     """Binary sensor that turns on when a print job errors."""
 
+    __slots__ = ("_notified",)
+
     _attr_device_class = "problem"
     _attr_translation_key = "job_error"
     _attr_translation_domain = DOMAIN
     _attr_icon = "mdi:alert-circle"
 
+    _NOTIFICATION_TITLE = f"{DOMAIN} – Print Job Error"
+    _NOTIFIED_TTL = 60
+
     def __init__(self, printer_name: str, entry_id: str) -> None:
         super().__init__(printer_name, entry_id)
         self._attr_name = f"{printer_name} Job Error"
         self._attr_unique_id = f"{entry_id}_job_error"
         self._attr_is_on = False  # required by Home Assistant core
-
-    async def async_added_to_hass(self) -> None:
-        # Store listener for later unsubscribe
-        self._unsub = self.hass.bus.async_listen(f"{DOMAIN}.status", self._handle_event)
+        # Recently notified (job_id, detail) keys; keeps a flapping
+        # bridge from spawning a notification task per toggling edge.
+        self._notified: set[str] = set()
 
     @callback
-    def _handle_event(self, event: Event) -> None:
-        if event.data.get("printer_name") != self._printer_name:
-            return
-        status = event.data.get("status")
+    def _apply_status(self, data: dict) -> None:
+        status = data.get("status")
         is_error = status == "error"
         # Only create a notification when the status changes to error
+        # and the same job/detail pair was not reported just now.
         if is_error and not self._attr_is_on:
-            self.hass.async_create_task(
-                self.hass.services.async_call(
-                    "persistent_notification",
-                    "create",
-                    {
-                        "title": f"{DOMAIN} – Print Job Error",
-                        "message": (
-                            f"Job {event.data.get('job_id')} failed: "
-                            f"{event.data.get('detail', '')}"
-                        ),
-                    },
+            key = f"{data.get('job_id')}:{data.get('detail', '')}"
+            if key not in self._notified:
+                self._notified.add(key)
+                self.hass.loop.call_later(
+                    self._NOTIFIED_TTL, self._notified.discard, key
                 )
-            )
-        self._attr_is_on = is_error
-        if self.hass and self.entity_id:
-            self.async_write_ha_state()
+                self.hass.async_create_task(
+                    self.hass.services.async_call(
+                        "persistent_notification",
+                        "create",
+                        {
+                            "title": self._NOTIFICATION_TITLE,
+                            "message": (
+                                f"Job {data.get('job_id')} failed: "
+                                f"{data.get('detail', '')}"
+                            ),
+                        },
+                    )
+                )
+        if is_error != self._attr_is_on:
+            self._attr_is_on = is_error
+            if self.hass and self.entity_id:
+                self.async_write_ha_state()
 
 
 
 class LastBridgeLogSensor(PosPrinterEntity, SensorEntity):
     """Sensor showing the latest bridge log message received via MQTT."""
 
+    __slots__ = ("_message", "_attrs")
+
     _attr_translation_key = "last_bridge_log"
     _attr_translation_domain = DOMAIN
     _attr_icon = "mdi:text-box-search-outline"
@@ -235,11 +313,7 @@ class LastBridgeLogSensor(PosPrinterEntity, SensorEntity):
         return self._attrs
 
     async def async_added_to_hass(self) -> None:
-        self.hass.bus.async_listen(f"{DOMAIN}.bridge_log", self._handle_event)
-
-    async def async_will_remove_from_hass(self) -> None:
-        if hasattr(self, "_unsub"):
-            self._unsub()
+        self._unsub = self.hass.bus.async_listen(_LOG_EVENT, self._handle_event)
 
     @callback
     def _handle_event(self, event: Event) -> None:
@@ -264,6 +338,8 @@ class LastBridgeLogSensor(PosPrinterEntity, SensorEntity):
 class SuccessfulJobsCounterSensor(PosPrinterEntity, SensorEntity):
     """Sensor counting the number of successful print jobs."""
 
+    __slots__ = ("_count",)
+
     _attr_translation_key = "successful_jobs"
     _attr_translation_domain = DOMAIN
     _attr_icon = "mdi:counter"
@@ -278,16 +354,9 @@ class SuccessfulJobsCounterSensor(PosPrinterEntity, SensorEntity):
     def native_value(self) -> int:
         return self._count
 
-    async def async_added_to_hass(self) -> None:
-        self._unsub = self.hass.bus.async_listen(
-            f"{DOMAIN}.status", self._handle_event
-        )
-
     @callback
-    def _handle_event(self, event: Event) -> None:
-        if event.data.get("printer_name") != self._printer_name:
-            return
-        if event.data.get("status") == "success":
+    def _apply_status(self, data: dict) -> None:
+        if data.get("status") == "success":
             self._count += 1
             if self.hass and self.entity_id:
                 self.async_write_ha_state()
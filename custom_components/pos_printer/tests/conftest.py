@@ -1,6 +1,90 @@
+import json
 import sys
 from pathlib import Path
 
+import pytest
+import pytest_asyncio
+
+# Stubbed in by the repository-root conftest before this module loads.
+from homeassistant.components import mqtt
+
 # Ensure repository root is on sys.path so 'custom_components' can be imported
 sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
 
+from custom_components.pos_printer.printer import setup_print_service  # noqa: E402
+from custom_components.pos_printer.tests.fakes import FakeHass  # noqa: E402
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speed-up only
+    uvloop = None
+
+if uvloop is not None:
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run the async tests on the libuv loop when available."""
+        return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture
+def fake_hass() -> FakeHass:
+    """Return a fresh FakeHass per test."""
+    return FakeHass()
+
+
+@pytest.fixture
+def add_sensor(fake_hass):
+    """Factory that constructs an entity and registers it with fake_hass."""
+
+    async def _add(entity_cls, printer_name="printer", entry_id="entry"):
+        entity = entity_cls(printer_name, entry_id)
+        entity.hass = fake_hass
+        await entity.async_added_to_hass()
+        return entity
+
+    return _add
+
+
+@pytest.fixture(scope="module")
+def mqtt_publish_mock():
+    """Mock mqtt.async_publish once per module and record calls."""
+    calls = []
+
+    async def fake_publish(hass, topic, payload, qos):
+        entry = {"topic": topic, "payload": payload, "qos": qos, "parsed": None}
+        # Decode JSON once at record time so assertions across
+        # parametrized tests don't re-parse the same payload.
+        if isinstance(payload, (str, bytes, bytearray)):
+            try:
+                entry["parsed"] = json.loads(payload)
+            except ValueError:
+                pass
+        calls.append(entry)
+
+    async def fake_wait_for_client(hass):
+        return
+
+    async def fake_subscribe(hass, topic, callback):
+        return lambda: None
+
+    mp = pytest.MonkeyPatch()
+    mp.setattr(mqtt, "async_publish", fake_publish)
+    mp.setattr(mqtt, "async_wait_for_mqtt_client", fake_wait_for_client)
+    mp.setattr(mqtt, "async_subscribe", fake_subscribe)
+    yield calls
+    mp.undo()
+
+
+@pytest.fixture(autouse=True)
+def _clear_publish_calls(mqtt_publish_mock):
+    """Reset the shared publish log between tests."""
+    mqtt_publish_mock.clear()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def printer_hass(mqtt_publish_mock):
+    """FakeHass with the print service set up once per module."""
+    hass = FakeHass()
+    await setup_print_service(hass, {"printer_name": "printer"})
+    return hass
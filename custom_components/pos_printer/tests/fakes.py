@@ -0,0 +1,103 @@
+"""Shared test doubles for the POS-Printer Bridge test suite."""
+
+
+def last_payload(publish_calls) -> dict:
+    """Return the decoded payload of the most recent recorded publish."""
+    return publish_calls[-1]["parsed"]
+
+
+class Evt:
+    """Slotted stand-in for bus events, service calls and MQTT messages."""
+
+    __slots__ = ("data", "payload")
+
+    def __init__(self, data=None, payload=None) -> None:
+        self.data = data
+        self.payload = payload
+
+
+class FakeBus:
+    """Minimal event bus that honors event names and listener filters.
+
+    Dispatch iterates the listener list directly; mutations copy the
+    list first when a fire is in progress (copy-on-write) instead of
+    snapshotting on every event.
+    """
+
+    def __init__(self) -> None:
+        # Insertion-ordered dict keyed by the listener entry: O(1)
+        # unsubscribe while keeping dispatch order stable.
+        self._cbs = {}
+        self.events: list[tuple[str, dict | None]] = []
+        self._firing = False
+
+    def async_listen(self, event, cb, event_filter=None):
+        entry = (event, cb, event_filter)
+        if self._firing:
+            self._cbs = self._cbs.copy()
+        self._cbs[entry] = None
+
+        def _remove() -> None:
+            if self._firing:
+                self._cbs = self._cbs.copy()
+            self._cbs.pop(entry, None)
+
+        return _remove
+
+    def async_fire(self, event, data=None):
+        self.events.append((event, data))
+        cbs = self._cbs
+        self._firing = True
+        try:
+            for listened, cb, event_filter in cbs:
+                if listened == event and (event_filter is None or event_filter(data)):
+                    cb(Evt(data))
+        finally:
+            self._firing = False
+
+    def async_listeners(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for event, _cb, _filter in self._cbs:
+            counts[event] = counts.get(event, 0) + 1
+        return counts
+
+
+class FakeServices:
+    """Minimal service registry for tests.
+
+    Services are stored as a nested ``{domain: {service: func}}`` dict,
+    so lookups hash two interned strings instead of building a tuple
+    key on every access.
+    """
+
+    def __init__(self) -> None:
+        self._services: dict[str, dict] = {}
+        self.removed: list[tuple[str, str]] = []
+
+    def async_register(self, domain, service, func, schema=None) -> None:
+        self._services.setdefault(domain, {})[service] = func
+
+    def has_service(self, domain, service) -> bool:
+        return service in self._services.get(domain, {})
+
+    def async_remove(self, domain, service) -> None:
+        self.removed.append((domain, service))
+        self._services.get(domain, {}).pop(service, None)
+
+    async def async_call(self, domain, service, data, blocking=True):
+        await self._services[domain][service](Evt(data=data))
+
+
+class FakeHass:
+    """Minimal hass object for tests."""
+
+    def __init__(self) -> None:
+        self.data = {}
+        self.bus = FakeBus()
+        self.services = FakeServices()
+
+    async def async_block_till_done(self):
+        return
+
+    async def async_add_executor_job(self, func, *args):
+        return func(*args)
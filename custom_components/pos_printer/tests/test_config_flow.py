@@ -1,10 +1,8 @@
-import pytest
 from homeassistant.core import HomeAssistant
 
 from custom_components.pos_printer.config_flow import PosPrinterConfigFlow
 
 
-@pytest.mark.asyncio
 async def test_mqtt_step_invalid_json():
     """Invalid discovery payload should abort the flow."""
     hass = HomeAssistant("")
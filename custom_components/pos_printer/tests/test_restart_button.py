@@ -1,25 +1,8 @@
-import pytest
+"""Tests for button entities of POS-Printer Bridge."""
 from custom_components.pos_printer.button import PiSoftwareUpdateButton, RestartButton
+from custom_components.pos_printer.tests.fakes import FakeHass
 
 
-class FakeHass:
-    async def async_block_till_done(self):
-        return
-
-
-@pytest.fixture(autouse=True)
-def mqtt_publish_mock(monkeypatch):
-    """Mock mqtt.async_publish and record calls."""
-    calls = []
-
-    async def fake_publish(hass, topic, payload, qos):
-        calls.append({"topic": topic, "payload": payload, "qos": qos})
-
-    monkeypatch.setattr("homeassistant.components.mqtt.async_publish", fake_publish)
-    return calls
-
-
-@pytest.mark.asyncio
 async def test_restart_button_publishes_command(mqtt_publish_mock):
     hass = FakeHass()
     button = RestartButton("printer", "entry")
@@ -31,7 +14,6 @@ async def test_restart_button_publishes_command(mqtt_publish_mock):
     assert call["payload"] == ""
 
 
-@pytest.mark.asyncio
 async def test_pi_update_button_publishes_command(mqtt_publish_mock):
     hass = FakeHass()
     button = PiSoftwareUpdateButton("printer", "entry")
@@ -1,6 +1,4 @@
 """Tests for sensor entities of POS-Printer Bridge."""
-from types import SimpleNamespace
-
 import pytest
 
 from custom_components.pos_printer.const import DOMAIN
@@ -13,52 +11,51 @@ from custom_components.pos_printer.sensor import (
     SuccessfulJobsCounterSensor,
 )
 
-
-class FakeBus:
-    def __init__(self) -> None:
-        self._cbs = []
-
-    def async_listen(self, _event, cb):
-        self._cbs.append(cb)
-
-        def _remove() -> None:
-            self._cbs.remove(cb)
-
-        return _remove
-
-    def async_fire(self, _event, data):
-        for cb in list(self._cbs):
-            cb(SimpleNamespace(data=data))
-
-
-class FakeHass:
-    def __init__(self) -> None:
-        self.bus = FakeBus()
-
-    async def async_block_till_done(self):
-        return
-
-
-@pytest.mark.asyncio
-async def test_sensors_update_states():
-    """Test that sensors update their states on status and bridge log events."""
-    hass = FakeHass()
-    sensors = [
-        LastJobStatusSensor("printer", "entry"),
-        LastJobIdSensor("printer", "entry"),
-        LastStatusTimestampSensor("printer", "entry"),
-        LastBridgeLogSensor("printer", "entry"),
-        JobErrorBinarySensor("printer", "entry"),
-        SuccessfulJobsCounterSensor("printer", "entry"),
-    ]
-
-    for sensor in sensors:
-        sensor.hass = hass
-        await sensor.async_added_to_hass()
+STATUS_EVENT = f"{DOMAIN}.status"
+LOG_EVENT = f"{DOMAIN}.bridge_log"
+
+_STATUS_DATA = {
+    "printer_name": "printer",
+    "status": "success",
+    "job_id": "1",
+    "timestamp": 1620000000,
+}
+_LOG_DATA = {
+    "printer_name": "printer",
+    "message": "worker online",
+    "level": "INFO",
+    "logger": "printer_bridge",
+    "timestamp": 1620000100,
+}
+
+
+@pytest.mark.parametrize(
+    ("sensor_cls", "getter", "expected"),
+    [
+        (LastJobStatusSensor, lambda s: s.state, "success"),
+        (LastJobIdSensor, lambda s: s.state, "1"),
+        (
+            LastStatusTimestampSensor,
+            lambda s: s.native_value.timestamp(),
+            1620000000,
+        ),
+        (JobErrorBinarySensor, lambda s: s.is_on, False),
+        (SuccessfulJobsCounterSensor, lambda s: s.state, 1),
+        (LastBridgeLogSensor, lambda s: s.state, "worker online"),
+        (
+            LastBridgeLogSensor,
+            lambda s: s.extra_state_attributes["level"],
+            "INFO",
+        ),
+    ],
+)
+async def test_sensors_update_states(fake_hass, add_sensor, sensor_cls, getter, expected):
+    """Sensors update their states on status and bridge log events."""
+    sensor = await add_sensor(sensor_cls)
 
     # Event for a different printer should be ignored.
-    hass.bus.async_fire(
-        f"{DOMAIN}.status",
+    fake_hass.bus.async_fire(
+        STATUS_EVENT,
         {
             "printer_name": "other",
             "status": "success",
@@ -67,53 +64,23 @@ async def test_sensors_update_states():
         },
     )
 
-    # Matching printer updates sensors.
-    hass.bus.async_fire(
-        f"{DOMAIN}.status",
-        {
-            "printer_name": "printer",
-            "status": "success",
-            "job_id": "1",
-            "timestamp": 1620000000,
-        },
-    )
-    hass.bus.async_fire(
-        f"{DOMAIN}.bridge_log",
-        {
-            "printer_name": "printer",
-            "message": "worker online",
-            "level": "INFO",
-            "logger": "printer_bridge",
-            "timestamp": 1620000100,
-        },
-    )
+    # Matching printer updates the sensor.
+    fake_hass.bus.async_fire(STATUS_EVENT, _STATUS_DATA)
+    fake_hass.bus.async_fire(LOG_EVENT, _LOG_DATA)
 
-    await hass.async_block_till_done()
+    # FakeBus dispatches synchronously, so no block-till-done is needed.
+    assert getter(sensor) == expected
 
-    assert sensors[0].state == "success"
-    assert sensors[1].state == "1"
-    assert sensors[2].native_value.timestamp() == 1620000000
-    assert sensors[3].state == "worker online"
-    assert sensors[3].extra_state_attributes["level"] == "INFO"
-    assert sensors[4].is_on is False
-    assert sensors[5].state == 1
 
-
-@pytest.mark.asyncio
-async def test_sensor_removes_listener():
+async def test_sensor_removes_listener(fake_hass, add_sensor):
     """Sensor should remove bus listener when removed from hass."""
-    hass = FakeHass()
-    sensor = LastJobStatusSensor("printer", "entry")
-    sensor.hass = hass
-
-    await sensor.async_added_to_hass()
-    assert hass.bus._cbs, "Listener was not registered"
+    sensor = await add_sensor(LastJobStatusSensor)
+    assert fake_hass.bus._cbs, "Listener was not registered"
 
     await sensor.async_will_remove_from_hass()
-    assert not hass.bus._cbs, "Listener was not removed"
+    assert not fake_hass.bus._cbs, "Listener was not removed"
 
-    hass.bus.async_fire(
-        f"{DOMAIN}.status", {"printer_name": "printer", "status": "success"}
+    fake_hass.bus.async_fire(
+        STATUS_EVENT, {"printer_name": "printer", "status": "success"}
     )
-    await hass.async_block_till_done()
     assert sensor.state is None
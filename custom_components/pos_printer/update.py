@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
 
 from homeassistant.components import mqtt
 from homeassistant.components.update import UpdateEntity, UpdateEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, Event, callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.json import json_dumps
 
 from .const import DOMAIN, VERSION
 from .sensor import PosPrinterEntity
@@ -38,6 +38,8 @@ async def async_setup_entry(
 class BridgeUpdateEntity(PosPrinterEntity, UpdateEntity):
     """Update entity handling bridge updates."""
 
+    __slots__ = ("_installed_version", "_latest_version", "_update_topic")
+
     _attr_translation_key = "bridge_update"
     _attr_translation_domain = DOMAIN
     _attr_icon = "mdi:update"
@@ -51,7 +53,9 @@ class BridgeUpdateEntity(PosPrinterEntity, UpdateEntity):
         self._attr_unique_id = f"{entry_id}_bridge_update"
         self._installed_version: str | None = None
         self._latest_version: str = _COMPONENT_VERSION
-        self._unsub = None
+        # Built once; async_install and every event dispatch would
+        # otherwise re-run the f-string formatting.
+        self._update_topic = f"print/pos/{printer_name}/update"
 
     @property
     def installed_version(self) -> str | None:
@@ -61,39 +65,28 @@ class BridgeUpdateEntity(PosPrinterEntity, UpdateEntity):
     def latest_version(self) -> str | None:
         return self._latest_version
 
-    async def async_added_to_hass(self) -> None:
-        """Register event listener for heartbeat messages."""
-        self._unsub = self.hass.bus.async_listen(
-            f"{DOMAIN}.status", self._handle_event
-        )
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Clean up listener on removal."""
-        if self._unsub:
-            self._unsub()
-            self._unsub = None
-
     @callback
-    def _handle_event(self, event: Event) -> None:
-        """Handle status or heartbeat events to extract version."""
-        if event.data.get("printer_name") != self._printer_name:
-            return
-        heartbeat: dict[str, Any] | None = event.data.get("heartbeat")
+    def _apply_status(self, data: dict) -> None:
+        """Extract the bridge version from a status or heartbeat event."""
+        heartbeat: dict[str, Any] | None = data.get("heartbeat")
         version = (
             heartbeat.get("version")
             if heartbeat
-            else event.data.get("version")
+            else data.get("version")
         )
-        if version:
-            if version != self._installed_version:
-                self._installed_version = str(version)
-                if self.hass and self.entity_id:
-                    self.async_write_ha_state()
+        if version and version != self._installed_version:
+            # Bridges report string versions; skip the str() copy then.
+            self._installed_version = (
+                version if isinstance(version, str) else str(version)
+            )
+            if self.hass and self.entity_id:
+                self.async_write_ha_state()
 
     async def async_install(self, version: str | None, backup: bool, **kwargs: Any) -> None:
         """Trigger an update of the bridge software via MQTT."""
         target_version = version or self._latest_version
-        payload = json.dumps({"version": target_version})
-        topic = f"print/pos/{self._printer_name}/update"
-        await mqtt.async_publish(self.hass, topic=topic, payload=payload, qos=1)
+        payload = json_dumps({"version": target_version})
+        await mqtt.async_publish(
+            self.hass, topic=self._update_topic, payload=payload, qos=1
+        )
         _LOGGER.debug("Sent update command for version %s", target_version)